@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import json
 import warnings
+from bisect import bisect_left
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from math import comb, floor
@@ -27,6 +28,7 @@ from rateslib.default import NoInput, PlotOutput, _drb, plot
 from rateslib.dual import (  # type: ignore[attr-defined]
     Arr1dF64,
     Arr1dObj,
+    Arr2dObj,
     Dual,
     Dual2,
     DualTypes,
@@ -35,13 +37,23 @@ from rateslib.dual import (  # type: ignore[attr-defined]
     dual_log,
     set_order_convert,
 )
-from rateslib.rs import Modifier, index_left_f64
+from rateslib.rs import Modifier
 from rateslib.rs import from_json as from_json_rs
 from rateslib.splines import PPSplineDual, PPSplineDual2, PPSplineF64
 
 if TYPE_CHECKING:
     from rateslib.fx import FXForwards  # pragma: no cover
 
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _posix(date: datetime) -> float:
+    # naive dates, which are those used throughout, are converted without attaching a timezone.
+    # The result is identical to ``date.replace(tzinfo=UTC).timestamp()`` and is much faster.
+    if date.tzinfo is None:
+        return (date - _EPOCH).total_seconds()
+    return date.replace(tzinfo=UTC).timestamp()
+
 
 # Licence: Creative Commons - Attribution-NonCommercial-NoDerivatives 4.0 International
 # Commercial use of this code, and/or copying and redistribution is prohibited.
@@ -363,7 +375,7 @@ class Curve:
         if defaults.curve_caching and date in self._cache:
             return self._cache[date]
 
-        date_posix = date.replace(tzinfo=UTC).timestamp()
+        date_posix = _posix(date)
         if isinstance(self.t, NoInput) or date <= self.t[0]:
             if callable(self.interpolation):
                 val: DualTypes = self.interpolation(date, self.nodes.copy())
@@ -391,7 +403,10 @@ class Curve:
     def _local_interp_(self, date_posix: float) -> DualTypes:
         if date_posix < self.node_dates_posix[0]:
             return 0  # then date is in the past and DF is zero
-        l_index = index_left_f64(self.node_dates_posix, date_posix, None)
+        # the interval is located by bisecting the node dates in place. This is equivalent to
+        # `index_left` but does not convert the list of node dates for every lookup.
+        posix = self.node_dates_posix
+        l_index = min(max(bisect_left(posix, date_posix) - 1, 0), len(posix) - 2)
         node_left_posix, node_right_posix = (
             self.node_dates_posix[l_index],
             self.node_dates_posix[l_index + 1],
@@ -2774,6 +2789,48 @@ class MultiCsaCurve(CompositeCurve):
 #         return self[date]
 
 
+def _proxy_df(
+    steps: tuple[tuple[int, int, bool], ...],
+    dfs: list[DualTypes],
+    fx_rates: tuple[DualTypes, ...],
+    fx_immediate: DualTypes,
+) -> DualTypes:
+    """
+    Return the DF of a :class:`ProxyCurve` from the DFs of the curves on its path.
+
+    The FX forward rate is chained over the ``steps``, with the immediate FX rate of each step
+    in ``fx_rates``, exactly as in :meth:`~rateslib.fx.FXForwards.rate`. ``dfs[0]`` is the
+    local collateral curve DF.
+    """
+    if not steps:
+        return 1.0 / fx_immediate * dfs[0]
+    # the product is started from the first FX rate rather than from unity, which would be an
+    # exact but wasted multiplication of a possibly Dual value
+    rate_: DualTypes = fx_rates[0]
+    for i, (w_i, v_i, by_col) in enumerate(steps):
+        if i > 0:
+            rate_ *= fx_rates[i]
+        rate_ *= dfs[w_i] / dfs[v_i] if by_col else dfs[v_i] / dfs[w_i]
+    return rate_ / fx_immediate * dfs[0]
+
+
+def _proxy_df_single_step(
+    steps: tuple[tuple[int, int, bool], ...],
+    dfs: list[DualTypes],
+    fx_rates: tuple[DualTypes, ...],
+    fx_immediate: DualTypes,
+) -> DualTypes:
+    """
+    Return the DF of a :class:`ProxyCurve` whose path has a single step.
+
+    This is :meth:`_proxy_df` without the loop, with identical arithmetic.
+    """
+    w_i, v_i, by_col = steps[0]
+    rate_: DualTypes = fx_rates[0]
+    rate_ *= dfs[w_i] / dfs[v_i] if by_col else dfs[v_i] / dfs[w_i]
+    return rate_ / fx_immediate * dfs[0]
+
+
 class ProxyCurve(Curve):
     """
     A subclass of :class:`~rateslib.curves.Curve` which returns dynamic DFs based on
@@ -2836,51 +2893,110 @@ class ProxyCurve(Curve):
         self._is_proxy = True
         self.fx_forwards = fx_forwards
         self.cash_currency = cash_ccy
-        self.cash_pair = f"{cash_ccy}{cash_ccy}"
         self.cash_idx = self.fx_forwards.currencies[cash_ccy]
+        # the local curve keys are shared with the FXForwards rather than built per instance
+        self.cash_pair = self.fx_forwards._local_curve_keys[self.cash_idx]
         self.coll_currency = coll_ccy
-        self.coll_pair = f"{coll_ccy}{coll_ccy}"
         self.coll_idx = self.fx_forwards.currencies[coll_ccy]
+        self.coll_pair = self.fx_forwards._local_curve_keys[self.coll_idx]
         self.pair = f"{cash_ccy}{coll_ccy}"
-        self.path = self.fx_forwards._get_recursive_chain(
-            self.fx_forwards.transform,
-            self.coll_idx,
-            self.cash_idx,
-            [],
-            [],
-        )[1]
-        self.terminal = list(self.fx_forwards.fx_curves[self.cash_pair].nodes.keys())[-1]
-
-        default_curve = Curve(
-            {},
-            convention=(
-                self.fx_forwards.fx_curves[self.cash_pair].convention
-                if convention is NoInput(0)
-                else convention
-            ),
-            modifier=(
-                self.fx_forwards.fx_curves[self.cash_pair].modifier
-                if modifier is NoInput.inherit
-                else modifier
-            ),
-            calendar=(
-                self.fx_forwards.fx_curves[self.cash_pair].calendar
-                if calendar is NoInput.inherit
-                else calendar
-            ),
+        # the path is resolved when first needed since many proxy curves are never evaluated
+        self._path: list[dict[str, int]] | None = None
+        self.terminal = next(reversed(self.fx_forwards.fx_curves[self.cash_pair].nodes))
+        # objects invariant for the life of the proxy curve are referenced once
+        self._rate_with_path = self.fx_forwards._rate_with_path
+        self._fx_immediate_array: Arr2dObj | None = None
+        self._fx_immediate_scalar: DualTypes = 1.0
+        self._chain_fx: tuple[DualTypes, ...] = ()
+
+        # parameters are inherited from the local cashflow curve, otherwise set as for a Curve
+        cash_curve = self.fx_forwards.fx_curves[self.cash_pair]
+        self.convention = (
+            cash_curve.convention
+            if convention is NoInput(0)
+            else _drb(defaults.convention, convention)
+        )
+        self.modifier = (
+            cash_curve.modifier
+            if modifier is NoInput.inherit
+            else _drb(defaults.modifier, modifier).upper()
+        )
+        self.calendar = (
+            cash_curve.calendar if calendar is NoInput.inherit else get_calendar(calendar)
         )
-        self.convention = default_curve.convention
-        self.modifier = default_curve.modifier
-        self.calendar = default_curve.calendar
         self.node_dates = [self.fx_forwards.immediate, self.terminal]
 
-    def __getitem__(self, date: datetime) -> DualTypes:
-        _1: DualTypes = self.fx_forwards._rate_with_path(self.pair, date, path=self.path)[0]
-        _2: DualTypes = self.fx_forwards.fx_rates_immediate._fx_array_el(
-            self.cash_idx, self.coll_idx
+    @property
+    def path(self) -> list[dict[str, int]]:
+        """The chain of currency collateral curves traversed to calculate FX forward rates."""
+        if self._path is None:
+            # paths are memoized on the FXForwards so proxy curves of the same pair share a search
+            self._path, steps = self.fx_forwards._get_path(self.coll_idx, self.cash_idx)
+            self._set_chain(steps)
+        return self._path
+
+    def _set_chain(self, steps: list[tuple[str, str, int, int, bool]]) -> None:
+        """
+        Resolve the ``steps`` of the path into curves and immediate FX rate indexes.
+
+        Each distinct curve on the path is evaluated once per date, and the steps reference
+        those DFs by position. The DFs of the local collateral curve are included, since the
+        path always starts from the collateral currency. Curves are stored by key and looked up
+        in the ``fx_curves`` of the *FXForwards* when evaluated, so replaced curves are used.
+        """
+        keys = list(dict.fromkeys([self.coll_pair, *(k for s in steps for k in s[:2])]))
+        self._chain_keys: tuple[str, ...] = tuple(keys)
+        self._chain_steps: tuple[tuple[int, int, bool], ...] = tuple(
+            (keys.index(w_key), keys.index(v_key), by_col) for w_key, v_key, _, _, by_col in steps
         )
-        _3: DualTypes = self.fx_forwards.fx_curves[self.coll_pair][date]
-        return _1 / _2 * _3
+        self._chain_fx_idx: tuple[tuple[int, int], ...] = tuple((s[2], s[3]) for s in steps)
+        # the DF function is specialised to the path length when it is known to be fixed
+        self._proxy_df = _proxy_df_single_step if len(steps) == 1 else _proxy_df
+        # FX rates on these dates are taken directly from the FXRates objects and not by chaining
+        fx_rates = self.fx_forwards.fx_rates
+        self._direct_settlements: set[datetime] = {
+            self.fx_forwards.fx_rates_immediate.settlement,
+            *([] if isinstance(fx_rates, list) else [fx_rates.settlement]),
+        }
+
+    def _maybe_set_fx(self) -> None:
+        # the immediate FX rates are cached against the ``fx_array`` they were taken from.
+        # Updating the FXForwards, or changing its AD order, creates a new array and so refreshes
+        # the values. Reading the scalars once avoids indexing the object array on every call.
+        fx_array = self.fx_forwards.fx_rates_immediate.fx_array
+        if fx_array is not self._fx_immediate_array:
+            _ = self.path  # the FX rates are indexed by the path, which is resolved on first use
+            self._fx_immediate_array = fx_array
+            self._fx_immediate_scalar = fx_array[self.cash_idx, self.coll_idx]
+            self._chain_fx = tuple(fx_array[row, col] for row, col in self._chain_fx_idx)
+
+    def __getitem__(self, date: datetime) -> DualTypes:
+        self._maybe_set_fx()
+        fx_curves = self.fx_forwards.fx_curves
+        if date in self._direct_settlements or date < self.fx_forwards.immediate:
+            # rates on these dates are direct, and dates before immediate raise
+            _1: DualTypes = self._rate_with_path(self.pair, date, path=self.path)[0]
+            return _1 / self._fx_immediate_scalar * fx_curves[self.coll_pair][date]
+        dfs = [fx_curves[key][date] for key in self._chain_keys]
+        return self._proxy_df(self._chain_steps, dfs, self._chain_fx, self._fx_immediate_scalar)
+
+    def _dfs_on_dates(self, dates: list[datetime]) -> Arr1dObj:
+        """
+        Return the DFs of the curve on multiple dates.
+
+        The FX forward rates are determined over all dates at once by
+        :meth:`~rateslib.fx.FXForwards._rates_on_dates`, and the DFs of the local collateral
+        curve evaluated in that process are reused.
+        """
+        dfs: dict[str, Arr1dObj] = {}
+        rates = self.fx_forwards._rates_on_dates(self.pair, dates, self.path, dfs)
+        if self.coll_pair not in dfs:
+            coll_curve = self.fx_forwards.fx_curves[self.coll_pair]
+            dfs[self.coll_pair] = np.array([coll_curve[date] for date in dates], dtype=object)
+        self._maybe_set_fx()
+        rates /= self._fx_immediate_scalar
+        rates *= dfs[self.coll_pair]
+        return rates
 
     def to_json(self) -> str:  # pragma: no cover  # type: ignore
         """
@@ -2896,11 +3012,28 @@ class ProxyCurve(Curve):
         """
         raise NotImplementedError("`from_json` not available on proxy curve.")
 
-    def _set_ad_order(self, order: int) -> None:  # pragma: no cover
+    @property
+    def ad(self) -> int:  # type: ignore[override]
+        """The AD order of the :class:`~rateslib.fx.FXForwards` which determines the DFs."""
+        return self.fx_forwards._ad
+
+    def _set_ad_order(self, order: int) -> None:
         """
-        Not implemented for :class:`~rateslib.fx.ProxyCurve` s.
+        Change the AD order of the :class:`~rateslib.fx.FXForwards` which determines the DFs.
+
+        A *ProxyCurve* has no nodes of its own, so the AD order of its DFs is that of the
+        curves and FX rates associated with its *FXForwards*. This is not local to the
+        *ProxyCurve*: every curve and FX rate of the *FXForwards* is changed, and therefore so
+        are all other curves derived from it. Callers which restore an AD order afterwards
+        must record the orders of all associated objects before setting any of them.
         """
-        raise NotImplementedError("`set_ad_order` not available on proxy curve.")
+        if order == self.ad:
+            return None
+        elif order not in [0, 1, 2]:
+            raise ValueError("`order` can only be in {0, 1, 2} for auto diff calcs.")
+
+        self.fx_forwards._set_ad_order(order)
+        return None
 
     def _get_node_vector(self) -> Arr1dF64 | Arr1dObj:  # pragma: no cover
         raise NotImplementedError("Instances of ProxyCurve do not have solvable variables.")
@@ -19,6 +19,8 @@ Arr1dF64: TypeAlias = "np.ndarray[tuple[int], np.dtype[np.float64]]"
 Arr2dF64: TypeAlias = "np.ndarray[tuple[int, int], np.dtype[np.float64]]"
 Arr1dObj: TypeAlias = "np.ndarray[tuple[int], np.dtype[np.object_]]"
 Arr2dObj: TypeAlias = "np.ndarray[tuple[int, int], np.dtype[np.object_]]"
+Arr3dF64: TypeAlias = "np.ndarray[tuple[int, int, int], np.dtype[np.float64]]"
+Arr1dI64: TypeAlias = "np.ndarray[tuple[int], np.dtype[np.int64]]"
 
 
 class Variable:
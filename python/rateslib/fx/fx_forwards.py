@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import json
-import warnings
+from collections import deque
 from datetime import datetime, timedelta
-from itertools import product
-from typing import Any
+from typing import Any, TypeAlias
 
 import numpy as np
 from pandas import DataFrame, Series
@@ -13,7 +12,8 @@ from rateslib.calendars import CalInput, add_tenor
 from rateslib.curves import Curve, LineCurve, MultiCsaCurve, ProxyCurve
 from rateslib.default import NoInput, PlotOutput, plot
 from rateslib.dual import Dual, DualTypes, Number, gradient
-from rateslib.fx.fx_rates import FXRates
+from rateslib.dual.variable import Arr1dObj
+from rateslib.fx.fx_rates import FXRates, _currency_not_found
 
 """
 .. ipython:: python
@@ -28,6 +28,8 @@ from rateslib.fx.fx_rates import FXRates
 # Commercial use of this code, and/or copying and redistribution is prohibited.
 # Contact rateslib at gmail.com if this code is observed outside its intended sphere.
 
+_PathStep: TypeAlias = tuple[str, str, int, int, bool]
+
 
 class FXForwards:
     """
@@ -209,6 +211,9 @@ class FXForwards:
                 self.terminal = curve.node_dates[-1]
 
     def _calculate_immediate_rates(self, base: str | NoInput, init: bool) -> None:
+        # paths depend only on the transformation matrix and are memoized as they are searched
+        self._paths: dict[tuple[int, int], tuple[list[dict[str, int]], list[_PathStep]]] = {}
+        self._pair_paths: dict[str, tuple[list[dict[str, int]], list[_PathStep]]] = {}
         if not isinstance(self.fx_rates, list):
             # if in initialisation phase (and not update phase) populate immutable values
             if init:
@@ -292,6 +297,12 @@ class FXForwards:
                 setattr(self, attr, getattr(acyclic_fxf, attr))
             self.pairs_settlement = settlement_pairs
 
+        # the neighbours used in path searches depend only on the transformation matrix
+        self._transform_neighbours = self._get_transform_neighbours(self.transform)
+
+        # the keys of the local currency curves, indexed as the currencies
+        self._local_curve_keys: tuple[str, ...] = tuple(f"{c}{c}" for c in self.currencies_list)
+
     def _calculate_immediate_rates_same_settlement_frame(self) -> FXRates:
         """
         Calculate the immediate FX rates values given current Curves and input FXRates obj.
@@ -307,23 +318,21 @@ class FXForwards:
         # since this is an internal method this line is used for testing
         assert not isinstance(self.fx_rates, list)  # noqa: S101
 
-        fx_rates_immediate: dict[str, DualTypes] = {}
-        for row in range(self.q):
-            for col in range(self.q):
-                if row == col or self.transform[row, col] == 0:
-                    continue
-                cash_ccy = self.currencies_list[row]
-                coll_ccy = self.currencies_list[col]
-                settlement = self.fx_rates.settlement
-                if settlement is NoInput.blank or settlement is None:
-                    raise ValueError(
-                        "`fx_rates` as FXRates supplied to FXForwards must contain a "
-                        "`settlement` argument.",
-                    )
-                v_i = self.fx_curves[f"{coll_ccy}{coll_ccy}"][settlement]
-                w_i = self.fx_curves[f"{cash_ccy}{coll_ccy}"][settlement]
-                pair = f"{cash_ccy}{coll_ccy}"
-                fx_rates_immediate.update({pair: self.fx_rates.fx_array[row, col] * v_i / w_i})
+        settlement = self.fx_rates.settlement
+        if settlement is NoInput.blank or settlement is None:
+            raise ValueError(
+                "`fx_rates` as FXRates supplied to FXForwards must contain a "
+                "`settlement` argument.",
+            )
+        ccys, fx_array = self.currencies_list, self.fx_rates.fx_array
+        rows, cols = np.nonzero(self.transform)
+        fx_rates_immediate: dict[str, DualTypes] = {
+            f"{ccys[row]}{ccys[col]}": fx_array[row, col]
+            * self.fx_curves[f"{ccys[col]}{ccys[col]}"][settlement]
+            / self.fx_curves[f"{ccys[row]}{ccys[col]}"][settlement]
+            for row, col in zip(rows.tolist(), cols.tolist(), strict=True)
+            if row != col
+        }
 
         fx_rates_immediate_ = FXRates(fx_rates_immediate, self.immediate, self.base)
         return fx_rates_immediate_.restate(self.fx_rates.pairs, keep_ad=True)
@@ -342,9 +351,8 @@ class FXForwards:
         fx_curves: dict[str, Curve], currencies: list[str]
     ) -> dict[str, Curve]:
         """produces a complete subset of fx curves given a list of currencies"""
-        ps = product(currencies, currencies)
-        ret = {p[0] + p[1]: fx_curves[p[0] + p[1]] for p in ps if p[0] + p[1] in fx_curves}
-        return ret
+        ccys = set(currencies)
+        return {k: v for k, v in fx_curves.items() if k[:3] in ccys and k[3:] in ccys}
 
     @staticmethod
     def _get_forwards_transformation_matrix(
@@ -358,38 +366,61 @@ class FXForwards:
         """
         # Define the transformation matrix with unit elements in each valid pair.
         T = np.zeros((q, q), dtype=int)
-        for k, _ in fx_curves.items():
-            cash, coll = k[:3].lower(), k[3:].lower()
+        for k in fx_curves:
+            k_ = k.lower()
+            cash, coll = k_[:3], k_[3:]
             try:
                 cash_idx, coll_idx = currencies[cash], currencies[coll]
             except KeyError:
                 raise ValueError(f"`fx_curves` contains an unexpected currency: {cash} or {coll}")
             T[cash_idx, coll_idx] = 1
 
-        if T.sum() > (2 * q) - 1:
+        n = int(T.sum())
+        if n > (2 * q) - 1:
             raise ValueError(
                 f"`fx_curves` is overspecified. {2 * q - 1} curves are expected "
                 f"but {len(fx_curves.keys())} provided.",
             )
-        elif T.sum() < (2 * q) - 1:
+        elif n < (2 * q) - 1:
             raise ValueError(
                 f"`fx_curves` is underspecified. {2 * q -1} curves are expected "
                 f"but {len(fx_curves.keys())} provided.",
             )
-        elif np.linalg.matrix_rank(T) != q:
+        elif round(np.linalg.det(T)) == 0:
+            # T is integer so has an integer determinant, which is zero only if T is rank deficient
             raise ValueError("`fx_curves` contains co-dependent rates.")
         return T
 
+    @staticmethod
+    def _get_transform_neighbours(
+        T: np.ndarray[tuple[int, int], np.dtype[np.int_]],
+    ) -> dict[int, list[tuple[str, int]]]:
+        """
+        Return the steps, by row and then by column, from each currency to its neighbours.
+
+        The neighbours of every currency are found with a single scan of the matrix.
+        """
+        steps: dict[int, list[tuple[str, int]]] = {i: [] for i in range(T.shape[0])}
+        rows, cols = np.nonzero(T)
+        for row, col in zip(rows.tolist(), cols.tolist(), strict=True):
+            if row != col:
+                steps[row].append(("row", col))
+        for row, col in zip(rows.tolist(), cols.tolist(), strict=True):
+            if row != col:
+                steps[col].append(("col", row))
+        return steps
+
     @staticmethod
     def _get_recursive_chain(
         T: np.ndarray[tuple[int, int], np.dtype[np.int_]],
         start_idx: int,
         search_idx: int,
-        traced_paths: list[int],
-        recursive_path: list[dict[str, int]],
+        traced_paths: list[int] | None = None,
+        recursive_path: list[dict[str, int]] | None = None,
+        neighbours: dict[int, list[tuple[str, int]]] | None = None,
     ) -> tuple[bool, list[dict[str, int]]]:
         """
-        Recursively calculate map from a cash currency to another via collateral curves.
+        Calculate map from a cash currency to another via collateral curves.
 
         Parameters
         ----------
@@ -399,10 +430,15 @@ class FXForwards:
             The index of the currency as the starting point of this search.
         search_idx : int
             The index of the currency identifying the termination of search.
-        traced_paths : list[int]
-            The index of currencies that have already been exhausted within the search.
-        recursive_path : list[dict]
-            The path taken from the original start to the current search start location.
+        traced_paths : list[int], optional
+            The index of currencies that have already been exhausted within the search, and
+            are not searched again.
+        recursive_path : list[dict], optional
+            The path taken from the original start to the current search start location,
+            which prefixes the returned path. Neither list is modified.
+        neighbours : dict, optional
+            The steps available from each currency, as returned by
+            :meth:`_get_transform_neighbours`. Derived from ``T`` if not given.
 
         Returns
         -------
@@ -421,39 +457,93 @@ class FXForwards:
            FXForwards._get_recursive_chain(T, 0, 3)
 
         """
-        recursive_path = recursive_path.copy()
-        traced_paths = traced_paths.copy()
-        if len(traced_paths) == 0:
-            traced_paths.append(start_idx)
-
-        # try row:
-        row_paths = np.where(T[start_idx, :] == 1)[0]
-        col_paths = np.where(T[:, start_idx] == 1)[0]
-        if search_idx in row_paths:
-            recursive_path.append({"row": search_idx})
-            return True, recursive_path
-        if search_idx in col_paths:
-            recursive_path.append({"col": search_idx})
-            return True, recursive_path
-
-        for axis, paths in [("row", row_paths), ("col", col_paths)]:
-            for path_idx in paths:
-                if path_idx == start_idx:
-                    pass
-                elif path_idx != search_idx and path_idx not in traced_paths:
-                    recursive_path_app = recursive_path + [{axis: path_idx}]
-                    traced_paths_app = traced_paths + [path_idx]
-                    recursion = FXForwards._get_recursive_chain(
-                        T,
-                        path_idx,
-                        search_idx,
-                        traced_paths_app,
-                        recursive_path_app,
-                    )
-                    if recursion[0]:
-                        return recursion
+        traced_paths = [] if traced_paths is None else traced_paths
+        recursive_path = [] if recursive_path is None else recursive_path
+        if T[start_idx, search_idx] == 1:
+            return True, [*recursive_path, {"row": search_idx}]
+        if T[search_idx, start_idx] == 1:
+            return True, [*recursive_path, {"col": search_idx}]
+
+        steps = FXForwards._get_transform_neighbours(T) if neighbours is None else neighbours
+
+        # breadth first search recording the step by which each currency is first reached
+        parents: dict[int, tuple[int, dict[str, int]]] = {}
+        visited = {start_idx, *traced_paths}
+        queue = deque([start_idx])
+        while queue:
+            idx = queue.popleft()
+            for axis, next_idx in steps[idx]:
+                if next_idx in visited:
+                    continue
+                visited.add(next_idx)
+                parents[next_idx] = (idx, {axis: next_idx})
+                if next_idx == search_idx:
+                    # stop when the search currency is first reached and walk back to the start
+                    path: list[dict[str, int]] = []
+                    while next_idx != start_idx:
+                        next_idx, step = parents[next_idx]
+                        path.append(step)
+                    return True, [*recursive_path, *reversed(path)]
+                queue.append(next_idx)
+
+        return False, [*recursive_path]
+
+    def _get_path(
+        self, start_idx: int, search_idx: int
+    ) -> tuple[list[dict[str, int]], list[_PathStep]]:
+        """Return the path, and its steps, between two currency indexes, memoizing the search."""
+        try:
+            return self._paths[(start_idx, search_idx)]
+        except KeyError:
+            path = self._get_recursive_chain(
+                self.transform, start_idx, search_idx, neighbours=self._transform_neighbours
+            )[1]
+            self._paths[(start_idx, search_idx)] = (path, self._get_path_steps(start_idx, path))
+            return self._paths[(start_idx, search_idx)]
+
+    def _get_path_steps(self, start_idx: int, path: list[dict[str, int]]) -> list[_PathStep]:
+        """
+        Return the curve keys and immediate FX rate indexes used in each step of a path.
+
+        Each step is a tuple of the cash-collateral curve key, the local collateral curve key,
+        the row and column index of the immediate FX rate and whether the step is by column.
+        """
+        steps: list[_PathStep] = []
+        current_idx = start_idx
+        for route in path:
+            if "col" in route:
+                next_idx, by_col = route["col"], True
+                cash_idx, coll_idx = next_idx, current_idx
+            elif "row" in route:
+                next_idx, by_col = route["row"], False
+                cash_idx, coll_idx = current_idx, next_idx
+            else:
+                continue
+            w_key = f"{self.currencies_list[cash_idx]}{self.currencies_list[coll_idx]}"
+            v_key = self._local_curve_keys[coll_idx]
+            steps.append((w_key, v_key, next_idx, current_idx, by_col))
+            current_idx = next_idx
+        return steps
+
+    def _get_pair_path(
+        self, pair: str, path: list[dict[str, int]] | NoInput = NoInput(0)
+    ) -> tuple[list[dict[str, int]], list[_PathStep]]:
+        """
+        Return the path, and its steps, for an FX pair, or the steps of a given ``path``.
 
-        return False, recursive_path
+        The pair is looked up directly to avoid resolving its currency indexes each call.
+        """
+        memo = self._pair_paths.get(pair, None)
+        if memo is not None and (isinstance(path, NoInput) or path == memo[0]):
+            return memo
+        domestic, foreign = pair[:3].lower(), pair[3:].lower()
+        d_idx: int = self.fx_rates_immediate.currencies[domestic]
+        f_idx: int = self.fx_rates_immediate.currencies[foreign]
+        path_, steps = self._get_path(f_idx, d_idx)
+        self._pair_paths[pair] = (path_, steps)
+        if isinstance(path, NoInput) or path == path_:
+            return path_, steps
+        return path, self._get_path_steps(f_idx, path)  # an alternative path is given
 
     # Licence: Creative Commons - Attribution-NonCommercial-NoDerivatives 4.0 International
     # Commercial use of this code, and/or copying and redistribution is prohibited.
@@ -526,17 +616,6 @@ class FXForwards:
         -------
         tuple
         """
-
-        def _get_d_f_idx_and_path(
-            pair: str, path: list[dict[str, int]] | NoInput
-        ) -> tuple[int, int, list[dict[str, int]]]:
-            domestic, foreign = pair[:3].lower(), pair[3:].lower()
-            d_idx: int = self.fx_rates_immediate.currencies[domestic]
-            f_idx: int = self.fx_rates_immediate.currencies[foreign]
-            if isinstance(path, NoInput):
-                path = self._get_recursive_chain(self.transform, f_idx, d_idx, [], [])[1]
-            return d_idx, f_idx, path
-
         # perform a fast conversion if settlement aligns with known dates,
         settlement_: datetime = self.immediate if isinstance(settlement, NoInput) else settlement
         if settlement_ < self.immediate:
@@ -544,38 +623,79 @@ class FXForwards:
 
         if settlement_ == self.fx_rates_immediate.settlement:
             rate_: DualTypes = self.fx_rates_immediate.rate(pair)
-            _, _, path = _get_d_f_idx_and_path(pair, path)
+            path, _ = self._get_pair_path(pair, path)
             return rate_, path
 
         elif isinstance(self.fx_rates, FXRates) and settlement_ == self.fx_rates.settlement:
             rate_ = self.fx_rates.rate(pair)
-            _, _, path = _get_d_f_idx_and_path(pair, path)
+            path, _ = self._get_pair_path(pair, path)
             return rate_, path
 
         # otherwise must rely on curves and path search which is slower
-        d_idx, f_idx, path = _get_d_f_idx_and_path(pair, path)
+        path, steps = self._get_pair_path(pair, path)
+        if len(steps) == 1:
+            # a pair with a direct cash-collateral curve requires no chaining
+            w_key, v_key, fx_row, fx_col, by_col = steps[0]
+            w_i = self.fx_curves[w_key][settlement_]
+            v_i = self.fx_curves[v_key][settlement_]
+            rate_ = self.fx_rates_immediate._fx_array_el(fx_row, fx_col)
+            return rate_ * (w_i / v_i if by_col else v_i / w_i), path
+
         rate_ = 1.0
-        current_idx = f_idx
-        for route in path:
-            if "col" in route:
-                coll_ccy = self.currencies_list[current_idx]
-                cash_ccy = self.currencies_list[route["col"]]
-                w_i = self.fx_curves[f"{cash_ccy}{coll_ccy}"][settlement_]
-                v_i = self.fx_curves[f"{coll_ccy}{coll_ccy}"][settlement_]
-                rate_ *= self.fx_rates_immediate._fx_array_el(route["col"], current_idx)
-                rate_ *= w_i / v_i
-                current_idx = route["col"]
-            elif "row" in route:
-                coll_ccy = self.currencies_list[route["row"]]
-                cash_ccy = self.currencies_list[current_idx]
-                w_i = self.fx_curves[f"{cash_ccy}{coll_ccy}"][settlement_]
-                v_i = self.fx_curves[f"{coll_ccy}{coll_ccy}"][settlement_]
-                rate_ *= self.fx_rates_immediate._fx_array_el(route["row"], current_idx)
-                rate_ *= v_i / w_i
-                current_idx = route["row"]
+        dfs: dict[str, DualTypes] = {}  # a collateral curve can be used in multiple steps
+        for w_key, v_key, fx_row, fx_col, by_col in steps:
+            if w_key not in dfs:
+                dfs[w_key] = self.fx_curves[w_key][settlement_]
+            if v_key not in dfs:
+                dfs[v_key] = self.fx_curves[v_key][settlement_]
+            w_i, v_i = dfs[w_key], dfs[v_key]
+            rate_ *= self.fx_rates_immediate._fx_array_el(fx_row, fx_col)
+            rate_ *= w_i / v_i if by_col else v_i / w_i
 
         return rate_, path
 
+    def _rates_on_dates(
+        self,
+        pair: str,
+        settlements: list[datetime],
+        path: list[dict[str, int]],
+        dfs: dict[str, Arr1dObj] | NoInput = NoInput(0),
+    ) -> Arr1dObj:
+        """
+        Return the fx forward rates for a currency pair on multiple settlement dates.
+
+        Each step of the ``path`` is traversed once, multiplying arrays of curve values
+        over all dates, rather than traversing the path separately for each date. The
+        arithmetic per date is identical to :meth:`_rate_with_path`.
+
+        The arrays of curve values are stored in ``dfs``, by curve key, if given. This
+        allows a caller to reuse those values, or to supply some already evaluated.
+        """
+        if any(settlement < self.immediate for settlement in settlements):
+            raise ValueError("`settlement` cannot be before immediate FX rate date.")
+
+        rates: Arr1dObj = np.full(len(settlements), 1.0, dtype=object)
+        _, steps = self._get_pair_path(pair, path)
+        # a collateral curve can be used in multiple steps so its values are only evaluated once
+        dfs_: dict[str, Arr1dObj] = {} if isinstance(dfs, NoInput) else dfs
+        for w_key, v_key, fx_row, fx_col, by_col in steps:
+            for key in (w_key, v_key):
+                if key not in dfs_:
+                    curve = self.fx_curves[key]
+                    dfs_[key] = np.array([curve[date] for date in settlements], dtype=object)
+            w, v = dfs_[w_key], dfs_[v_key]
+            # products are taken in place so that no intermediate array is allocated per step
+            rates *= self.fx_rates_immediate._fx_array_el(fx_row, fx_col)
+            rates *= w / v if by_col else v / w
+
+        # rates on the settlement dates of FXRates objects are taken directly from those objects
+        for i, settlement in enumerate(settlements):
+            if settlement == self.fx_rates_immediate.settlement:
+                rates[i] = self.fx_rates_immediate.rate(pair)
+            elif isinstance(self.fx_rates, FXRates) and settlement == self.fx_rates.settlement:
+                rates[i] = self.fx_rates.rate(pair)
+        return rates
+
     def positions(
         self, value: Number, base: str | NoInput = NoInput(0), aggregate: bool = False
     ) -> Series[float] | DataFrame:
@@ -623,9 +743,6 @@ class FXForwards:
         if isinstance(value, float | int):
             value = Dual(value, [], [])
         base_: str = self.base if isinstance(base, NoInput) else base.lower()
-        _ = np.array(
-            [0 if ccy != base_ else float(value) for ccy in self.currencies_list],
-        )  # this is an NPV so is assumed to be immediate settlement
 
         if isinstance(self.fx_rates, list):
             fx_rates = self.fx_rates
@@ -635,8 +752,14 @@ class FXForwards:
         dates = list({fxr.settlement for fxr in fx_rates})
         if self.immediate not in dates:
             dates.insert(0, self.immediate)
-        df = DataFrame(0.0, index=self.currencies_list, columns=dates)
-        df.loc[base_, self.immediate] = float(value)
+
+        # positions are accumulated in an array indexed by currency and settlement date
+        rows = {ccy: i for i, ccy in enumerate(self.currencies_list)}
+        cols = {date: j for j, date in enumerate(dates)}
+        positions = np.zeros((self.q, len(dates)), dtype=np.float64)
+        # this is an NPV so is assumed to be immediate settlement
+        positions[rows[base_], cols[self.immediate]] = float(value)
+        sort_rows, sort_cols = False, False
         for pair in value.vars:
             if pair[:3] == "fx_":
                 dom_, for_ = pair[3:6], pair[6:9]
@@ -644,8 +767,17 @@ class FXForwards:
                     if dom_ in fxr.currencies_list and for_ in fxr.currencies_list:
                         delta = gradient(value, [pair])[0]
                         _ = fxr._get_positions_from_delta(delta, pair[3:], base_)
-                        _ = Series(_, index=fxr.currencies_list, name=fxr.settlement)
-                        df = df.add(_.to_frame(), fill_value=0.0)
+                        idx = [rows[ccy] for ccy in fxr.currencies_list]
+                        positions[idx, cols[fxr.settlement]] += _
+                        # retain the label ordering of an aligned DataFrame addition
+                        sort_rows = sort_rows or fxr.currencies_list != self.currencies_list
+                        sort_cols = sort_cols or len(dates) > 1
+
+        df = DataFrame(positions, index=self.currencies_list, columns=dates)
+        if sort_rows:
+            df = df.sort_index(axis=0)
+        if sort_cols:
+            df = df.sort_index(axis=1)
 
         if aggregate:
             _s: Series[float] = df.sum(axis=1).rename(dates[0])
@@ -718,18 +850,10 @@ class FXForwards:
         foreign = self.base if isinstance(foreign, NoInput) else foreign.lower()
         domestic = domestic.lower()
         collateral = domestic if isinstance(collateral, NoInput) else collateral.lower()
-        for ccy in [domestic, foreign]:
-            if ccy not in self.currencies:
-                if on_error == "ignore":
-                    return None
-                elif on_error == "warn":
-                    warnings.warn(
-                        f"'{ccy}' not in FXForwards.currencies: returning None.",
-                        UserWarning,
-                    )
-                    return None
-                else:
-                    raise ValueError(f"'{ccy}' not in FXForwards.currencies.")
+        if domestic not in self.currencies or foreign not in self.currencies:
+            ccy = domestic if domestic not in self.currencies else foreign
+            _currency_not_found(ccy, on_error, "FXForwards")
+            return None
 
         settlement_: datetime = self.immediate if isinstance(settlement, NoInput) else settlement
         value_date_: datetime = settlement_ if isinstance(value_date, NoInput) else value_date
@@ -802,15 +926,20 @@ class FXForwards:
         else:
             array_ = DataFrame({self.immediate: np.asarray(array)}, index=self.currencies_list)
 
-        # j = self.currencies[base]
-        # return np.sum(array_ * self.fx_array[:, j])
+        # currencies not contained in the FX framework are ignored
+        if base in self.currencies:
+            ccys = [ccy for ccy in array_.index if ccy.lower() in self.currencies]
+        else:
+            ccys = []
         sum: DualTypes = 0.0
         for d in array_.columns:
+            # the positions on each date are converted with a single dot product of FX rates
             d_sum: DualTypes = 0.0
-            for ccy in array_.index:
+            if len(ccys) > 0:
+                positions = array_.loc[ccys, d].to_numpy(dtype=object)
                 # typing d is a datetime by default.
-                value_: DualTypes | None = self.convert(array_.loc[ccy, d], ccy, base, d)  # type: ignore[arg-type]
-                d_sum += 0.0 if value_ is None else value_
+                rates = [self.rate(f"{ccy.lower()}{base}", d) for ccy in ccys]  # type: ignore[arg-type]
+                d_sum += np.dot(positions, np.array(rates, dtype=object))
             if abs(d_sum) < 1e-2:
                 sum += d_sum
             else:  # only discount if there is a real value
@@ -873,20 +1002,14 @@ class FXForwards:
 
         The returned curve has each DF uniquely specified on each date.
         """
-        cash_ccy, coll_ccy = cashflow.lower(), collateral.lower()
-        cash_idx, coll_idx = self.currencies[cash_ccy], self.currencies[coll_ccy]
-        path = self._get_recursive_chain(self.transform, coll_idx, cash_idx, [], [])[1]
-        end = list(self.fx_curves[f"{coll_ccy}{coll_ccy}"].nodes.keys())[-1]
+        coll_idx = self.currencies[collateral.lower()]
+        v_curve = self.fx_curves[self._local_curve_keys[coll_idx]]
+        end = list(v_curve.nodes.keys())[-1]
         days = (end - self.immediate).days
-        nodes = {
-            k: (
-                self._rate_with_path(f"{cash_ccy}{coll_ccy}", k, path=path)[0]
-                / self.fx_rates_immediate.fx_array[cash_idx, coll_idx]
-                * self.fx_curves[f"{coll_ccy}{coll_ccy}"][k]
-            )
-            for k in [self.immediate + timedelta(days=i) for i in range(days + 1)]
-        }
-        return Curve(nodes)
+        dates = [self.immediate + timedelta(days=i) for i in range(days + 1)]
+        # the values are those of the equivalent proxy curve, evaluated over all dates at once
+        values = ProxyCurve(cashflow, collateral, self)._dfs_on_dates(dates)
+        return Curve(dict(zip(dates, values, strict=True)))
 
     # Licence: Creative Commons - Attribution-NonCommercial-NoDerivatives 4.0 International
     # Commercial use of this code, and/or copying and redistribution is prohibited.
@@ -1019,7 +1142,7 @@ class FXForwards:
         points: int = (right_ - left_).days
         x = [left_ + timedelta(days=i) for i in range(points)]
         _, path = self._rate_with_path(pair, x[0])
-        rates: list[DualTypes] = [self._rate_with_path(pair, _, path=path)[0] for _ in x]
+        rates: list[DualTypes] = self._rates_on_dates(pair, x, path).tolist()
         if not fx_swap:
             y: list[list[DualTypes]] = [rates]
         else:
@@ -1028,15 +1151,11 @@ class FXForwards:
 
     def _set_ad_order(self, order: int) -> None:
         self._ad = order
-        for curve in self.fx_curves.values():
-            curve._set_ad_order(order)
-
-        if isinstance(self.fx_rates, list):
-            for fx_rates in self.fx_rates:
-                fx_rates._set_ad_order(order)
-        else:
-            self.fx_rates._set_ad_order(order)
-        self.fx_rates_immediate._set_ad_order(order)
+        # objects are collected on each call since curves in ``fx_curves`` may be replaced
+        fx_rates = self.fx_rates if isinstance(self.fx_rates, list) else [self.fx_rates]
+        objs: list[Curve | FXRates] = [*self.fx_curves.values(), *fx_rates, self.fx_rates_immediate]
+        for obj in objs:
+            obj._set_ad_order(order)
 
     def to_json(self) -> str:
         if isinstance(self.fx_rates, list):
@@ -1086,6 +1205,8 @@ class FXForwards:
 
     def __eq__(self, other: Any) -> bool:
         """Test two FXForwards are identical"""
+        if self is other:
+            return True
         if type(self) is not type(other):
             return False
         for attr in ["base"]:
@@ -1117,9 +1238,6 @@ class FXForwards:
 
         return True
 
-    def __ne__(self, other: Any) -> bool:
-        return not self.__eq__(other)
-
     def copy(self) -> FXForwards:
         """
         An FXForwards copy creates a new object with copied references.
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import warnings
+from copy import copy
 from datetime import datetime
 from functools import cached_property
 from typing import Any
@@ -10,8 +11,15 @@ from pandas import DataFrame, Series
 
 from rateslib import defaults
 from rateslib.default import NoInput, _drb, _make_py_json
-from rateslib.dual import Dual, DualTypes, Number, _get_adorder, gradient
-from rateslib.dual.variable import Arr1dF64, Arr1dObj, Arr2dObj
+from rateslib.dual import Dual, DualTypes, Number, _dual_float, _get_adorder, gradient
+from rateslib.dual.variable import (
+    Arr1dF64,
+    Arr1dI64,
+    Arr1dObj,
+    Arr2dF64,
+    Arr2dObj,
+    Arr3dF64,
+)
 from rateslib.rs import Ccy, FXRate
 from rateslib.rs import FXRates as FXRatesObj
 
@@ -30,6 +38,15 @@ from rateslib.rs import FXRates as FXRatesObj
 # Contact rateslib at gmail.com if this code is observed outside its intended sphere.
 
 
+def _currency_not_found(ccy: str, on_error: str, name: str) -> None:
+    """Perform the ``on_error`` action when a currency is not contained in an FX object."""
+    if on_error == "warn":
+        warnings.warn(f"'{ccy}' not in {name}.currencies: returning None.", UserWarning)
+    elif on_error != "ignore":
+        raise ValueError(f"'{ccy}' not in {name}.currencies.")
+    return None
+
+
 class FXRates:
     """
     Object to store and calculate FX rates for a consistent settlement date.
@@ -98,6 +115,15 @@ class FXRates:
 
     """
 
+    _cached_properties = (
+        "fx_array",
+        "_fx_rates_f",
+        "_fx_tree_f",
+        "_fx_array_f",
+        "_fx_array_jac",
+        "_json",
+    )
+
     def __init__(
         self,
         fx_rates: dict[str, DualTypes],
@@ -120,21 +146,37 @@ class FXRates:
     @classmethod
     def __init_from_obj__(cls, obj: FXRatesObj) -> FXRates:
         """Construct the class instance from a given rust object which is wrapped."""
-        # create a default instance and overwrite it
-        new = cls({"usdeur": 1.0}, datetime(2000, 1, 1))
+        # allocate an instance without constructing, and validating, a default Rust object
+        new = cls.__new__(cls)
         new.obj = obj
         new.__init_post_obj__()
         return new
 
     def __init_post_obj__(self) -> None:
-        self.currencies = {ccy.name: i for (i, ccy) in enumerate(self.obj.currencies)}
+        # the currencies are transferred from Rust once and indexed in the same pass
+        self._currencies_list: list[str] = []
+        self.currencies: dict[str, int] = {}
+        for i, ccy in enumerate(self.obj.currencies):
+            self._currencies_list.append(ccy.name)
+            self.currencies[ccy.name] = i
+        # the pairs are immutable for the life of the object so are listed once
+        self._pairs: list[str] = [fxr.pair for fxr in self.obj.fx_rates]
+        # index lookups of pairs are memoized: the majors are populated and crosses added on use
+        self._pair_idx: dict[str, tuple[int, int]] = {
+            pair: (self.currencies[pair[:3]], self.currencies[pair[3:]]) for pair in self._pairs
+        }
         self.__clear_cached_properties__()
 
     def __clear_cached_properties__(self) -> None:
-        self.__dict__.pop("fx_array", None)
+        for attr in self._cached_properties:
+            self.__dict__.pop(attr, None)
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if isinstance(other, FXRates):
+            if self._currencies_list != other._currencies_list or self._pairs != other._pairs:
+                return False  # cheap structural checks before the full comparison in Rust
             return self.obj == other.obj
         return False
 
@@ -142,9 +184,17 @@ class FXRates:
         return not self.__eq__(other)
 
     def __copy__(self) -> FXRates:
-        obj = FXRates.__init_from_obj__(self.obj.__copy__())
-        obj.__init_post_obj__()
-        return obj
+        # the Python state is copied directly, including any cached arrays, to avoid rebuilding it
+        new = FXRates.__new__(FXRates)
+        new.obj = self.obj.__copy__()
+        new._currencies_list = self._currencies_list.copy()
+        new.currencies = self.currencies.copy()
+        new._pairs = self._pairs.copy()
+        new._pair_idx = self._pair_idx.copy()
+        for attr in self._cached_properties:
+            if attr in self.__dict__:
+                new.__dict__[attr] = copy(self.__dict__[attr])
+        return new
 
     def __repr__(self) -> str:
         if len(self.currencies_list) > 5:
@@ -160,6 +210,59 @@ class FXRates:
         # caching this prevents repetitive data transformations between Rust/Python
         return np.array(self.obj.fx_array)  # type: ignore[return-value]
 
+    @cached_property
+    def _fx_tree_f(self) -> tuple[Arr1dF64, Arr2dF64]:
+        # the FX pairs form a spanning tree over the currencies, so the rate of the base currency
+        # against every currency, x, is a product of pair rates along the tree from the base. Its
+        # gradient with respect to the rate, r_k, of pair k is then +/- x / r_k if the pair is on
+        # that path and zero otherwise. No linear system is solved for either.
+        q, rates = self.q, [self._fx_rates_f[pair] for pair in self._pairs]
+        adjacency: list[list[tuple[int, int, bool]]] = [[] for _ in range(q)]
+        for k, pair in enumerate(self._pairs):
+            dom, for_ = self._pair_idx[pair]
+            adjacency[dom].append((for_, k, True))  # each pair yields: x_for = r * x_dom
+            adjacency[for_].append((dom, k, False))
+
+        x = np.zeros(q, dtype=np.float64)
+        signs = np.zeros((q, len(rates)), dtype=np.float64)
+        x[0] = 1.0  # the base currency is always indexed first
+        visited, stack = {0}, [0]
+        while stack:
+            i = stack.pop()
+            for j, k, forward in adjacency[i]:
+                if j not in visited:
+                    visited.add(j)
+                    x[j] = x[i] * rates[k] if forward else x[i] / rates[k]
+                    signs[j] = signs[i]
+                    signs[j, k] = 1.0 if forward else -1.0
+                    stack.append(j)
+        dx: Arr2dF64 = signs * x[:, np.newaxis] / np.array(rates)[np.newaxis, :]
+        return x, dx
+
+    @cached_property
+    def _fx_array_f(self) -> Arr2dF64:
+        # the float rates are cast from the rates of the Rust object, rather than derived from the
+        # FX pairs, so that float calculations agree exactly with ``rate`` and ``convert``.
+        return np.array([[_dual_float(v) for v in row] for row in self.fx_array], dtype=np.float64)
+
+    @cached_property
+    def _fx_array_jac(self) -> Arr3dF64:
+        # the gradient of every element of the float FX array with respect to the FX pair
+        # ``variables``, indexed [i, j, k]. Together with the float array this is a dense
+        # alternative to the object array of Duals for first order calculations.
+        (x, dx), fx_array = self._fx_tree_f, self._fx_array_f
+        # each element is x_j / x_i so its gradient is (dx_j - fx_ij * dx_i) / x_i
+        jac: Arr3dF64 = dx[np.newaxis, :, :] - fx_array[:, :, np.newaxis] * dx[:, np.newaxis, :]
+        return jac / x[:, np.newaxis, np.newaxis]
+
+    @cached_property
+    def _fx_rates_f(self) -> dict[str, float]:
+        # float values of the pair rates, avoiding repeated casts of the Dual rates from Rust
+        return {
+            pair: _dual_float(fxr.rate)
+            for pair, fxr in zip(self._pairs, self.obj.fx_rates, strict=True)
+        }
+
     def _fx_array_el(self, i: int, j: int) -> Number:
         # this is for typing since this numpy object array can only hold float | Dual | Dual2
         return self.fx_array[i, j]  # type: ignore
@@ -174,7 +277,7 @@ class FXRates:
 
     @property
     def pairs(self) -> list[str]:
-        return [fxr.pair for fxr in self.obj.fx_rates]
+        return self._pairs.copy()
 
     @property
     def fx_rates(self) -> dict[str, DualTypes]:
@@ -182,11 +285,11 @@ class FXRates:
 
     @property
     def currencies_list(self) -> list[str]:
-        return [ccy.name for ccy in self.obj.currencies]
+        return self._currencies_list.copy()
 
     @property
     def q(self) -> int:
-        return len(self.obj.currencies)
+        return len(self._currencies_list)
 
     @property
     def fx_vector(self) -> Arr1dObj:
@@ -198,7 +301,7 @@ class FXRates:
 
     @property
     def variables(self) -> tuple[str, ...]:
-        return tuple(f"fx_{pair}" for pair in self.pairs)
+        return tuple(f"fx_{pair}" for pair in self._pairs)
 
     @property
     def _ad(self) -> int:
@@ -225,9 +328,18 @@ class FXRates:
            fxr = FXRates({"usdeur": 2.0, "usdgbp": 2.5})
            fxr.rate("eurgbp")
         """
-        domi, fori = self.currencies[pair[:3].lower()], self.currencies[pair[3:].lower()]
+        domi, fori = self._get_pair_idx(pair)
         return self._fx_array_el(domi, fori)
 
+    def _get_pair_idx(self, pair: str) -> tuple[int, int]:
+        """Return the domestic and foreign currency indexes of a pair, memoizing the lookup."""
+        try:
+            return self._pair_idx[pair]
+        except KeyError:
+            idx = (self.currencies[pair[:3].lower()], self.currencies[pair[3:].lower()])
+            self._pair_idx[pair] = idx
+            return idx
+
     def restate(self, pairs: list[str], keep_ad: bool = False) -> FXRates:
         """
         Create a new :class:`FXRates` class using other (or fewer) currency pairs as majors.
@@ -353,7 +465,7 @@ class FXRates:
             return None
         fx_rates_ = [FXRate(k[0:3], k[3:6], v, self.settlement) for k, v in fx_rates.items()]
         self.obj.update(fx_rates_)
-        self.__init_post_obj__()
+        self.__clear_cached_properties__()  # currencies and pairs are unaffected by an update
 
     def convert(
         self,
@@ -392,24 +504,68 @@ class FXRates:
            fxr.convert(1000000, "nok", "inr")  # <- returns None, "inr" not in fxr.
 
         """
-        foreign = self.base if isinstance(foreign, NoInput) else foreign.lower()
-        domestic = domestic.lower()
-        for ccy in [domestic, foreign]:
-            if ccy not in self.currencies:
-                if on_error == "ignore":
-                    return None
-                elif on_error == "warn":
-                    warnings.warn(
-                        f"'{ccy}' not in FXRates.currencies: returning None.",
-                        UserWarning,
-                    )
-                    return None
-                else:
-                    raise ValueError(f"'{ccy}' not in FXRates.currencies.")
-
-        i, j = self.currencies[domestic.lower()], self.currencies[foreign.lower()]
+        try:
+            # lowercase codes are matched directly, without allocating a lowered string
+            i = self.currencies[domestic]
+            j = 0 if isinstance(foreign, NoInput) else self.currencies[foreign]  # base is first
+        except KeyError:
+            foreign = self.base if isinstance(foreign, NoInput) else foreign.lower()
+            domestic = domestic.lower()
+            if domestic not in self.currencies or foreign not in self.currencies:
+                ccy = domestic if domestic not in self.currencies else foreign
+                _currency_not_found(ccy, on_error, "FXRates")
+                return None
+            i, j = self.currencies[domestic], self.currencies[foreign]
         return value * self._fx_array_el(i, j)
 
+    def convert_many(
+        self,
+        values: Arr1dF64 | Arr1dObj | list[DualTypes],
+        domestic_idx: Arr1dI64 | list[int],
+        foreign_idx: Arr1dI64 | list[int],
+    ) -> Arr1dF64 | Arr1dObj:
+        """
+        Convert multiple amounts of domestic currencies into foreign currencies simultaneously.
+
+        Parameters
+        ----------
+        values : list, 1d ndarray of floats or dual types
+            The amounts of the domestic currencies to convert.
+        domestic_idx : list, 1d ndarray of int
+            The index of the domestic currency of each amount, as defined in the attribute
+            ``FXRates.currencies``.
+        foreign_idx : list, 1d ndarray of int
+            The index of the foreign currency to convert each amount to, as defined in the
+            attribute ``FXRates.currencies``.
+
+        Returns
+        -------
+        1d ndarray
+
+        Notes
+        -----
+        No validation of the currencies is performed, unlike
+        :meth:`~rateslib.fx.FXRates.convert`. If no AD is set and ``values`` are floats
+        then a float array is returned, otherwise an object array of dual types is returned.
+
+        Examples
+        --------
+
+        .. ipython:: python
+
+           fxr = FXRates({"usdnok": 8.0})
+           fxr.currencies
+           fxr.convert_many([1000000, 1000000], [1, 0], [0, 1])
+
+        """
+        values_ = np.asarray(values)
+        domestic_idx_, foreign_idx_ = np.asarray(domestic_idx), np.asarray(foreign_idx)
+        if self._ad == 0 and values_.dtype.kind in "fiu":
+            fx_array: Arr2dF64 | Arr2dObj = self._fx_array_f
+        else:
+            fx_array = self.fx_array
+        return values_ * fx_array[domestic_idx_, foreign_idx_]  # type: ignore[no-any-return]
+
     def convert_positions(
         self,
         array: Arr1dF64 | list[float],
@@ -440,9 +596,21 @@ class FXRates:
            fxr.currencies
            fxr.convert_positions([0, 1000000], "usd")
         """
-        base = self.base if isinstance(base, NoInput) else base.lower()
+        if isinstance(base, NoInput):
+            j = 0  # the base currency is always indexed first
+        else:
+            j = self.currencies[base] if base in self.currencies else self.currencies[base.lower()]
         array_ = np.asarray(array)
-        j = self.currencies[base]
+        if self._ad == 0 and array_.dtype.kind in "fiu":
+            # no sensitivities are required so perform a float dot product without Dual objects
+            return float(array_ @ self._fx_array_f[:, j])
+        elif self._ad == 1 and array_.dtype.kind in "fiu":
+            # the value and its gradient are float dot products and only the result is a Dual
+            return Dual(
+                float(array_ @ self._fx_array_f[:, j]),
+                list(self.variables),
+                (array_ @ self._fx_array_jac[:, j, :]).tolist(),
+            )
         return np.sum(array_ * self.fx_array[:, j])  # type: ignore[no-any-return]
 
     def positions(
@@ -477,29 +645,34 @@ class FXRates:
         if isinstance(value, float | int):
             value = Dual(value, [], [])
         base_: str = self.base if isinstance(base, NoInput) else base.lower()
-        _ = np.array([0 if ccy != base_ else value.real for ccy in self.currencies_list])
-        for pair in value.vars:
-            if pair[:3] == "fx_":
-                delta = gradient(value, [pair])[0]
-                _ += self._get_positions_from_delta(delta, pair[3:], base_)
+        _ = np.zeros(self.q, dtype=np.float64)
+        if base_ in self.currencies:  # a base not in the object has no cash position
+            _[self.currencies[base_]] = value.real
+        fx_vars = [var for var in value.vars if var[:3] == "fx_"]
+        if len(fx_vars) > 0:
+            deltas: Arr1dF64 = gradient(value, fx_vars)  # type: ignore[assignment]
+            _ += self._get_positions_from_deltas(deltas, [var[3:] for var in fx_vars], base_)
         return Series(_, index=self.currencies_list)
 
-    def _get_positions_from_delta(
-        self, delta: float, pair: str, base: str
-    ) -> np.ndarray[tuple[int], np.dtype[np.float64]]:
+    def _get_positions_from_delta(self, delta: float, pair: str, base: str) -> Arr1dF64:
         """Return an array of cash positions determined from an FX pair delta risk."""
+        return self._get_positions_from_deltas(np.array([delta]), [pair], base)
+
+    def _get_positions_from_deltas(self, deltas: Arr1dF64, pairs: list[str], base: str) -> Arr1dF64:
+        """Return an array of cash positions determined from multiple FX pair delta risks."""
         b_idx = self.currencies[base]
-        domestic, foreign = pair[:3], pair[3:]
-        d_idx, f_idx = self.currencies[domestic], self.currencies[foreign]
-        _: np.ndarray[tuple[int], np.dtype[np.float64]] = np.zeros(self.q, dtype=np.float64)
+        idx = np.array([self._get_pair_idx(pair) for pair in pairs], dtype=np.intp)
+        d_idx, f_idx = idx[:, 0], idx[:, 1]
+        _: Arr1dF64 = np.zeros(self.q, dtype=np.float64)
 
         # f_val = -delta * float(self.fx_array[b_idx, d_idx]) * float(self.fx_array[d_idx,f_idx])**2
         # _[f_idx] = f_val
         # _[d_idx] = -f_val / float(self.fx_array[d_idx, f_idx])
         # return _
-        f_val = delta * float(self._fx_array_el(b_idx, f_idx))
-        _[d_idx] = f_val
-        _[f_idx] = -f_val / float(self._fx_array_el(f_idx, d_idx))
+        f_vals = deltas * self._fx_array_f[b_idx, f_idx]
+        # pairs may share currencies so positions are accumulated with unbuffered addition
+        np.add.at(_, d_idx, f_vals)
+        np.add.at(_, f_idx, -f_vals / self._fx_array_f[f_idx, d_idx])
         return _  # calculation is more efficient from a domestic pov than foreign
 
     def rates_table(self) -> DataFrame:
@@ -511,7 +684,7 @@ class FXRates:
         DataFrame
         """
         return DataFrame(
-            np.vectorize(float)(self.fx_array),
+            self._fx_array_f.copy(),  # copied so that the cached array is not exposed to mutation
             index=self.currencies_list,
             columns=self.currencies_list,
         )
@@ -525,6 +698,11 @@ class FXRates:
         self.__init_post_obj__()
 
     def to_json(self) -> str:
+        return self._json
+
+    @cached_property
+    def _json(self) -> str:
+        # serialization is repeated for unchanged objects, e.g. in FXForwards.copy
         return _make_py_json(self.obj.to_json(), "FXRates")
 
 
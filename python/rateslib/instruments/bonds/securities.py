@@ -783,6 +783,7 @@ class BondMixin:
 
         # perform one final approximation albeit the additional price calculation slows calc time
         disc_curve = curves[1].shift(z_hat + z_hat2, composite=False)
+        # the shifted and copied curves are new objects, so their orders are set without restoring
         disc_curve._set_ad_order(0)
         if fore_curve is not None:
             fore_curve._set_ad_order(0)
@@ -413,14 +413,15 @@ class BaseLeg(metaclass=ABCMeta):
         # derivatives' method, but it is a more costly and less robust method
         # due to its need to work in second order mode.
 
-        fore_ad = fore_curve.ad
-        fore_curve._set_ad_order(2)
+        # orders are recorded before any are set, since a ProxyCurve shares the AD order of its
+        # FXForwards, and with it of other curves and FX rates which may also be given here
+        fore_ad, disc_ad = fore_curve.ad, disc_curve.ad
+        if isinstance(fx, FXRates | FXForwards):
+            _fx = None if fx is None else fx._ad
 
-        disc_ad = disc_curve.ad
+        fore_curve._set_ad_order(2)
         disc_curve._set_ad_order(2)
-
         if isinstance(fx, FXRates | FXForwards):
-            _fx = None if fx is None else fx._ad
             fx._set_ad_order(2)
 
         npv = self.npv(fore_curve, disc_curve, fx, self.currency)
@@ -447,10 +448,11 @@ class BaseLeg(metaclass=ABCMeta):
 
         # This is required by the Dual2 AD approach to revert to original order.
         self.float_spread = _fs
-        fore_curve._set_ad_order(fore_ad)
-        disc_curve._set_ad_order(disc_ad)
+        # restored in reverse so that each object ends with the order recorded for it
         if isinstance(fx, FXRates | FXForwards):
             fx._set_ad_order(_fx)
+        disc_curve._set_ad_order(disc_ad)
+        fore_curve._set_ad_order(fore_ad)
         _ = set_order(_, disc_ad)  # use disc_ad: credit spread from disc curve
 
         return _
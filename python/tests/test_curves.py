@@ -4,6 +4,7 @@ from math import exp, log
 import numpy as np
 import pytest
 from matplotlib import pyplot as plt
+from pytz import UTC
 from rateslib import default_context
 from rateslib.calendars import get_calendar
 from rateslib.curves import (
@@ -15,6 +16,7 @@ from rateslib.curves import (
     index_left,
     interpolate,
 )
+from rateslib.curves.curves import _posix
 from rateslib.default import NoInput
 from rateslib.dual import Dual, Dual2, gradient
 from rateslib.fx import FXForwards, FXRates
@@ -98,6 +100,45 @@ def test_log_linear_interp() -> None:
     assert all(np.isclose(gradient(result, ["v0", "v1"]), expected.dual))
 
 
+@pytest.mark.parametrize(
+    ("date", "expected"),
+    [
+        (dt(2022, 3, 1), 1.00),
+        (dt(2022, 3, 31), 0.99),
+        (dt(2022, 4, 15), exp((log(0.99) + log(0.98)) / 2)),
+        (dt(2022, 4, 30), 0.98),
+        (dt(2022, 5, 15), exp(log(0.98) * 1.5 - log(0.99) * 0.5)),  # extrapolate
+    ],
+)
+def test_log_linear_interp_node_intervals(date, expected) -> None:
+    # node dates are attributed to the interval on their left, and beyond the final node the
+    # last interval is extrapolated
+    curve = Curve(
+        nodes={
+            dt(2022, 3, 1): 1.00,
+            dt(2022, 3, 31): 0.99,
+            dt(2022, 4, 30): 0.98,
+        },
+        interpolation="log_linear",
+    )
+    assert abs(curve[date] - expected) < 1e-14
+
+
+@pytest.mark.parametrize(
+    "date",
+    [
+        dt(1970, 1, 1),
+        dt(1969, 12, 31),
+        dt(2022, 3, 16),
+        dt(2022, 3, 16, 13, 45, 10, 123456),
+        dt(2200, 1, 1),
+        dt(2022, 3, 16, tzinfo=UTC),
+    ],
+)
+def test_posix(date) -> None:
+    assert _posix(date) == date.replace(tzinfo=UTC).timestamp()
+
+
 def test_linear_zero_rate_interp() -> None:
     # not tested
     pass
@@ -84,6 +84,78 @@ def test_convert_and_base() -> None:
     assert np.all(result3 == np.array([0, 1e6]))
 
 
+@pytest.mark.parametrize("base", ["usd", "nok"])
+def test_fx_array_float_single_pair(base) -> None:
+    fxr = FXRates({"usdnok": 8.0}, base=base)
+    i, j = fxr.currencies["usd"], fxr.currencies["nok"]
+    assert fxr._fx_array_f[i, j] == 8.0
+    assert fxr._fx_array_f[j, i] == 0.125
+    assert np.all(np.abs(fxr._fx_array_jac[i, j] - np.array([1.0])) < 1e-12)
+
+
+def test_fx_array_jac_matches_dual_array() -> None:
+    # the float gradients derived along the tree of pairs equal those of the Dual array
+    fxr = FXRates({"usdeur": 0.9, "gbpusd": 1.25, "eurnok": 11.0, "sekeur": 0.09})
+    for i in range(fxr.q):
+        for j in range(fxr.q):
+            expected = gradient(fxr.fx_array[i, j], list(fxr.variables))
+            assert abs(fxr._fx_array_f[i, j] - float(fxr.fx_array[i, j])) < 1e-12
+            assert np.all(np.abs(fxr._fx_array_jac[i, j] - expected) < 1e-12)
+
+
+def test_rate_memoized_pair_index() -> None:
+    fxr = FXRates({"usdeur": 2.0, "usdgbp": 2.5})
+    expected = Dual(1.25, ["fx_usdeur", "fx_usdgbp"], [-0.625, 0.50])
+    assert fxr.rate("EURgbp") == expected
+    assert fxr.rate("EURgbp") == expected  # the memoized cross returns the same rate
+
+    fxr.update({"usdgbp": 3.0})
+    assert fxr.rate("EURgbp") == FXRates({"usdeur": 2.0, "usdgbp": 3.0}).rate("EURgbp")
+
+
+def test_convert_positions_float_ad_zero() -> None:
+    fxr = FXRates({"usdnok": 8.0})
+    fxr._set_ad_order(0)
+    result = fxr.convert_positions(np.array([100.0, 1e6]), "usd")
+    assert type(result) is float
+    assert abs(result - 125100.0) < 1e-9
+
+
+def test_convert_positions_ad_one_matches_dual_array() -> None:
+    fxr = FXRates({"usdnok": 8.0, "eurusd": 1.05, "gbpeur": 1.15})
+    positions = np.array([1e6, -2e6, 3e5, 4e5])
+    result = fxr.convert_positions(positions, "nok")
+    expected = np.sum(positions * fxr.fx_array[:, fxr.currencies["nok"]])
+    assert abs(result.real - expected.real) < 1e-6
+    grad = gradient(result, list(fxr.variables))
+    assert np.all(np.abs(grad - gradient(expected, list(fxr.variables))) < 1e-6)
+
+
+def test_convert_many() -> None:
+    fxr = FXRates({"usdnok": 8.0})
+    result = fxr.convert_many([1e6, 1e6, 5.0], [1, 0, 0], [0, 1, 0])
+    expected = [
+        fxr.convert(1e6, "nok", "usd"),
+        fxr.convert(1e6, "usd", "nok"),
+        fxr.convert(5.0, "usd", "usd"),
+    ]
+    for r, e in zip(result, expected, strict=True):
+        assert r == e
+
+    fxr._set_ad_order(0)
+    result = fxr.convert_many(np.array([1e6, 1e6]), [1, 0], [0, 1])
+    assert result.dtype == np.float64
+    assert np.all(np.abs(result - np.array([125000.0, 8e6])) < 1e-9)
+
+
+def test_convert_mixed_case() -> None:
+    fxr = FXRates({"usdnok": 8.0})
+    assert fxr.convert(1e6, "NOK", "Usd") == fxr.convert(1e6, "nok", "usd")
+    assert fxr.convert(1e6, "NOK") == fxr.convert(1e6, "nok")
+    assert fxr.convert_positions([0, 1e6], "USD") == fxr.convert_positions([0, 1e6], "usd")
+    assert fxr.convert(1e6, "NOK", "INR") is None
+
+
 def test_convert_none() -> None:
     fxr = FXRates({"usdnok": 8.0})
     assert fxr.convert(1, "usd", "gbp") is None
@@ -107,6 +179,25 @@ def test_positions_value() -> None:
     assert all(result == np.array([0, 80.0]))
 
 
+def test_positions_value_base_not_in_currencies() -> None:
+    fxr = FXRates({"usdnok": 8.0})
+    result = fxr.positions(80, "gbp")
+    assert all(result == np.array([0.0, 0.0]))
+
+
+def test_positions_multiple_fx_vars() -> None:
+    fxr = FXRates({"usdnok": 8.0, "usdeur": 0.9})
+    value = Dual(1000.0, ["fx_usdnok", "fx_usdeur", "curve0"], [-50.0, 200.0, 1.0])
+    result = fxr.positions(value, "usd")
+    expected = (
+        np.array([1000.0, 0.0, 0.0])
+        + fxr._get_positions_from_delta(-50.0, "usdnok", "usd")
+        + fxr._get_positions_from_delta(200.0, "usdeur", "usd")
+    )
+    assert np.all(np.isclose(result.to_numpy(), expected))
+    assert abs(fxr.convert_positions(result.to_numpy(), "usd").real - 1000.0) < 1e-9
+
+
 def test_fxrates_set_order() -> None:
     fxr = FXRates({"usdnok": 8.0})
     fxr._set_ad_order(order=2)
@@ -146,6 +237,39 @@ def test_rates_table() -> None:
     assert_frame_equal(result, expected)
 
 
+def test_fx_array_float_equals_dual_array() -> None:
+    fxr = FXRates({"eurusd": 1.08, "usdjpy": 110.0, "gbpjpy": 140.0}, base="usd")
+    expected = np.vectorize(float)(fxr.fx_array)
+    assert np.all(fxr._fx_array_f == expected)
+
+    fxr.update({"usdjpy": 120.0})
+    expected = np.vectorize(float)(fxr.fx_array)
+    assert np.all(fxr._fx_array_f == expected)
+
+
+@pytest.mark.parametrize("ad", [0, 1])
+def test_float_conversions_equal_rate(ad) -> None:
+    fxr = FXRates({"eurusd": 1.08, "usdjpy": 110.3, "gbpjpy": 140.7, "audusd": 0.67}, base="usd")
+    fxr._set_ad_order(ad)
+    ccys = fxr.currencies_list
+    table = fxr.rates_table()
+    for dom in ccys:
+        for for_ in ccys:
+            assert table.loc[dom, for_] == float(fxr.rate(f"{dom}{for_}"))
+
+    idx = list(range(fxr.q))
+    result = fxr.convert_many([1e6] * fxr.q, idx, idx[::-1])
+    for i, value in enumerate(result):
+        assert float(value) == float(fxr.convert(1e6, ccys[i], ccys[-1 - i]))
+
+    # a single position is converted exactly, several differ only by the order of summation
+    for i, ccy in enumerate(ccys):
+        positions = [0.0] * fxr.q
+        positions[i] = 1e6
+        result = fxr.convert_positions(positions, "gbp")
+        assert float(result) == float(fxr.convert(1e6, ccy, "gbp"))
+
+
 def test_fxrates_to_json() -> None:
     fxr = FXRates({"usdnok": 8.0, "eurusd": 1.05})
     result = fxr.to_json()
@@ -168,6 +292,16 @@ def test_fxrates_to_json() -> None:
     assert result == expected
 
 
+def test_fxrates_to_json_cache_invalidated_on_update() -> None:
+    fxr = FXRates({"usdnok": 8.0, "eurusd": 1.05})
+    result = fxr.to_json()
+    assert result is fxr.to_json()
+    fxr.update({"usdnok": 9.0})
+    result2 = fxr.to_json()
+    assert '"rate":{"F64":9.0}' in result2
+    assert result != result2
+
+
 def test_from_json_and_equality() -> None:
     fxr1 = FXRates({"usdnok": 8.0, "eurusd": 1.05})
     fxr2 = FXRates({"usdnok": 2.0, "eurusd": 4.0})
@@ -189,6 +323,17 @@ def test_copy() -> None:
     assert id(fxr1) != id(fxr2)
 
 
+def test_copy_cached_arrays_independent() -> None:
+    fxr1 = FXRates({"usdnok": 8.0, "eurusd": 1.05}, settlement=dt(2022, 1, 3))
+    fxr1.rate("eurnok")  # populate the cached arrays before copying
+    fxr2 = fxr1.__copy__()
+    assert fxr2.currencies == fxr1.currencies
+    fxr2.update({"usdnok": 9.0})
+    assert abs(fxr2.rate("usdnok") - 9.0) < 1e-12
+    assert abs(fxr1.rate("usdnok") - 8.0) < 1e-12
+    assert abs(fxr1.rates_table().loc["usd", "nok"] - 8.0) < 1e-12
+
+
 def test_set_ad_order() -> None:
     fxr = FXRates({"usdnok": 10.0})
     fxr._set_ad_order(1)
@@ -335,6 +480,17 @@ def test_fxforwards_set_order(usdusd, eureur, usdeur) -> None:
     assert usdeur.ad == 2
 
 
+def test_fxforwards_set_order_replaced_curve(usdusd, eureur, usdeur) -> None:
+    fxf = FXForwards(
+        FXRates({"usdeur": 2.0}, settlement=dt(2022, 1, 3)),
+        {"usdusd": usdusd, "eureur": eureur, "usdeur": usdeur},
+    )
+    new_usdusd = usdusd.copy()
+    fxf.fx_curves["usdusd"] = new_usdusd
+    fxf._set_ad_order(order=2)
+    assert new_usdusd.ad == 2
+
+
 def test_fxforwards_set_order_list(usdusd, eureur, usdeur) -> None:
     fxf = FXForwards(
         [
@@ -519,6 +675,25 @@ def test_fxforwards_convert(usdusd, eureur, usdeur) -> None:
     assert np.isclose(expected.dual, result.dual)
 
 
+def test_fxforwards_convert_positions(usdusd, eureur, usdeur) -> None:
+    fxf = FXForwards(
+        FXRates({"usdeur": 0.9}, settlement=dt(2022, 1, 3)),
+        {"usdusd": usdusd, "eureur": eureur, "usdeur": usdeur},
+    )
+    positions = DataFrame(
+        index=["usd", "EUR", "gbp"],
+        data={dt(2022, 2, 1): [1e6, -5e5, 1e6], dt(2022, 3, 1): [0.0, 2e5, 0.0]},
+    )
+    result = fxf.convert_positions(positions, "eur")
+    expected = 0.0
+    for d in positions.columns:
+        d_sum = fxf.convert(positions.loc["usd", d], "usd", "eur", d)
+        d_sum += fxf.convert(positions.loc["EUR", d], "eur", "eur", d)
+        expected += fxf.convert(d_sum, "eur", "eur", d, fxf.immediate)
+    assert abs(result - expected) < 1e-9
+    assert np.all(np.isclose(gradient(result, ["fx_usdeur"]), gradient(expected, ["fx_usdeur"])))
+
+
 def test_fxforwards_convert_not_in_ccys(usdusd, eureur, usdeur) -> None:
     fxf = FXForwards(
         FXRates({"usdeur": 0.9}, settlement=dt(2022, 1, 3)),
@@ -607,6 +782,38 @@ def test_recursive_chain_interim_broken_path() -> None:
     assert result == expected
 
 
+def test_recursive_chain_default_args() -> None:
+    T = np.array([[1, 1, 1, 0], [0, 1, 0, 0], [0, 0, 1, 1], [0, 0, 0, 1]])
+    assert FXForwards._get_recursive_chain(T, 0, 3) == (True, [{"row": 2}, {"row": 3}])
+    assert FXForwards._get_recursive_chain(T, 3, 1) == (True, [{"col": 2}, {"col": 0}, {"row": 1}])
+
+
+def test_recursive_chain_traced_paths() -> None:
+    T = np.array([[1, 1, 1, 0], [0, 1, 0, 0], [0, 0, 1, 1], [0, 0, 0, 1]])
+    traced_paths, recursive_path = [2], [{"row": 1}]
+    result = FXForwards._get_recursive_chain(T, 0, 3, traced_paths, recursive_path)
+    assert result == (False, [{"row": 1}])
+
+    result = FXForwards._get_recursive_chain(T, 0, 3, [1], recursive_path)
+    assert result == (True, [{"row": 1}, {"row": 2}, {"row": 3}])
+    assert traced_paths == [2]
+    assert recursive_path == [{"row": 1}]
+
+
+def test_recursive_chain_given_neighbours() -> None:
+    T = np.array([[1, 1, 1, 0], [0, 1, 0, 0], [0, 0, 1, 1], [0, 0, 0, 1]])
+    neighbours = FXForwards._get_transform_neighbours(T)
+    assert neighbours == {
+        0: [("row", 1), ("row", 2)],
+        1: [("col", 0)],
+        2: [("row", 3), ("col", 0)],
+        3: [("col", 2)],
+    }
+    for start, search in [(0, 3), (3, 1), (1, 2)]:
+        result = FXForwards._get_recursive_chain(T, start, search, neighbours=neighbours)
+        assert result == FXForwards._get_recursive_chain(T, start, search)
+
+
 def test_multiple_currencies_number_raises(usdusd) -> None:
     fxr1 = FXRates({"eurusd": 0.95}, settlement=dt(2022, 1, 3))
     fxr2 = FXRates({"gbpcad": 1.1}, settlement=dt(2022, 1, 2))
@@ -749,6 +956,119 @@ def test_proxy_curves_update_with_underlying() -> None:
     assert prev_value != new_value
 
 
+@pytest.fixture
+def fxf_cadeur():
+    # cad and eur are each collateralised in usd with immediate rates on different dates
+    fxr1 = FXRates({"usdeur": 0.95}, dt(2022, 1, 3))
+    fxr2 = FXRates({"usdcad": 1.1}, dt(2022, 1, 2))
+    fxf = FXForwards(
+        [fxr1, fxr2],
+        {
+            "usdusd": Curve({dt(2022, 1, 1): 1.0, dt(2022, 10, 1): 0.95}),
+            "eureur": Curve({dt(2022, 1, 1): 1.0, dt(2022, 10, 1): 1.0}),
+            "eurusd": Curve({dt(2022, 1, 1): 1.0, dt(2022, 10, 1): 0.99}),
+            "cadusd": Curve({dt(2022, 1, 1): 1.00, dt(2022, 10, 1): 0.97}),
+            "cadcad": Curve({dt(2022, 1, 1): 1.00, dt(2022, 10, 1): 0.969}),
+        },
+    )
+    return fxf
+
+
+@pytest.fixture
+def fxf_eurusd():
+    fxr = FXRates({"eurusd": 1.1}, dt(2022, 1, 3))
+    fxf = FXForwards(
+        fxr,
+        {
+            "usdusd": Curve({dt(2022, 1, 1): 1.0, dt(2022, 10, 1): 0.95}),
+            "eureur": Curve({dt(2022, 1, 1): 1.0, dt(2022, 10, 1): 0.98}),
+            "usdeur": Curve({dt(2022, 1, 1): 1.0, dt(2022, 10, 1): 0.96}),
+        },
+    )
+    return fxf
+
+
+@pytest.fixture
+def fxf_usdnok():
+    # nok is collateralised in eur so usdnok is derived in two steps
+    fxr = FXRates({"usdnok": 8.0, "eurusd": 1.05}, settlement=dt(2022, 1, 3))
+    fxf = FXForwards(
+        fxr,
+        {
+            "usdusd": Curve({dt(2022, 1, 1): 1.0, dt(2022, 1, 10): 0.999}),
+            "eureur": Curve({dt(2022, 1, 1): 1.0, dt(2022, 1, 10): 0.998}),
+            "eurusd": Curve({dt(2022, 1, 1): 1.0, dt(2022, 1, 10): 0.9985}),
+            "noknok": Curve({dt(2022, 1, 1): 1.0, dt(2022, 1, 10): 0.997}),
+            "nokeur": Curve({dt(2022, 1, 1): 1.0, dt(2022, 1, 10): 0.9965}),
+        },
+    )
+    return fxf
+
+
+def test_proxy_curves_update_with_fx_rates(fxf_cadeur) -> None:
+    # the cached immediate FX rate of a ProxyCurve must reflect an FXForwards update and AD order
+    fxf = fxf_cadeur
+    proxy_curve = fxf.curve("cad", "eur")
+    proxy_curve[dt(2022, 10, 1)]
+    fxf.update([{"usdeur": 1.5}, {"usdcad": 1.4}])
+    result = proxy_curve[dt(2022, 10, 1)]
+    expected = fxf.curve("cad", "eur")[dt(2022, 10, 1)]
+    assert abs(result - expected) < 1e-14
+
+    fxf._set_ad_order(0)
+    result = proxy_curve[dt(2022, 10, 1)]
+    assert isinstance(result, float)
+    assert abs(result - float(expected)) < 1e-14
+
+
+@pytest.mark.parametrize(
+    "date", [dt(2022, 1, 1), dt(2022, 1, 2), dt(2022, 1, 3), dt(2022, 5, 17), dt(2022, 10, 1)]
+)
+def test_proxy_curve_equals_fx_parity(fxf_cadeur, date) -> None:
+    # the DFs chained by the proxy curve are identical to those derived from FXForwards.rate
+    fxf = fxf_cadeur
+    result = fxf.curve("cad", "eur")[date]
+    expected = fxf.rate("cadeur", date) / fxf.rate("cadeur") * fxf.fx_curves["eureur"][date]
+    assert abs(result - expected) < 1e-14
+
+    with pytest.raises(ValueError, match="`settlement` cannot be before immediate"):
+        fxf.curve("cad", "eur")[dt(2021, 12, 31)]
+
+
+def test_proxy_curve_set_ad_order(fxf_eurusd) -> None:
+    fxf = fxf_eurusd
+    proxy_curve = fxf.curve("eur", "usd")
+    assert proxy_curve.ad == 1
+    proxy_curve._set_ad_order(0)
+    assert proxy_curve.ad == 0
+    assert fxf._ad == 0
+    assert isinstance(proxy_curve[dt(2022, 6, 15)], float)
+
+    proxy_curve._set_ad_order(1)
+    assert proxy_curve.ad == 1
+    assert isinstance(proxy_curve[dt(2022, 6, 15)], Dual)
+
+    # the order is that of the FXForwards, however it is set
+    fxf._set_ad_order(0)
+    assert proxy_curve.ad == 0
+    proxy_curve._set_ad_order(1)
+    assert fxf._ad == 1
+    assert isinstance(proxy_curve[dt(2022, 6, 15)], Dual)
+
+    with pytest.raises(ValueError, match="`order` can only be in"):
+        proxy_curve._set_ad_order(3)
+
+
+def test_proxy_curve_single_step(fxf_eurusd) -> None:
+    # the only curve of the pair is collateralised in the cashflow currency
+    fxf = fxf_eurusd
+    proxy_curve = fxf.curve("eur", "usd")
+    assert len(proxy_curve.path) == 1
+    date = dt(2022, 6, 15)
+    expected = fxf.rate("eurusd", date) / fxf.rate("eurusd") * fxf.fx_curves["usdusd"][date]
+    assert abs(proxy_curve[date] - expected) < 1e-14
+
+
 def test_full_curves(usdusd, eureur, usdeur) -> None:
     usdusd = Curve({dt(2022, 1, 1): 1.0, dt(2022, 1, 10): 0.999})
     eureur = Curve({dt(2022, 1, 1): 1.0, dt(2022, 1, 10): 0.998})
@@ -771,6 +1091,58 @@ def test_full_curves(usdusd, eureur, usdeur) -> None:
     assert len(curve.nodes) == 10  # constructed with DF on every date
 
 
+def test_proxy_curve_dfs_on_dates(fxf_usdnok) -> None:
+    fxf = fxf_usdnok
+    proxy_curve = fxf.curve("usd", "nok")
+    dates = [dt(2022, 1, 1), dt(2022, 1, 3), dt(2022, 1, 6), dt(2022, 1, 10)]
+    result = proxy_curve._dfs_on_dates(dates)
+    for i, date in enumerate(dates):
+        assert abs(result[i] - proxy_curve[date]) < 1e-15
+
+
+def test_proxy_curve_uses_replaced_curves(fxf_usdnok) -> None:
+    fxf = fxf_usdnok
+    proxy_curve = fxf.curve("usd", "nok")
+    before = proxy_curve[dt(2022, 1, 6)]
+    fxf.fx_curves["noknok"] = Curve({dt(2022, 1, 1): 1.0, dt(2022, 1, 10): 0.99})
+    fxf.fx_curves["nokeur"] = Curve({dt(2022, 1, 1): 1.0, dt(2022, 1, 10): 0.992})
+    dates = [dt(2022, 1, 3), dt(2022, 1, 6)]
+    expected = [fxf.curve("usd", "nok")[date] for date in dates]
+    result = [proxy_curve[date] for date in dates]
+    assert result == expected
+    for i, df in enumerate(proxy_curve._dfs_on_dates(dates)):
+        assert abs(df - expected[i]) < 1e-15
+    assert abs(result[1] - before) > 1e-6
+
+
+def test_rates_on_dates_equals_rate(fxf_usdnok) -> None:
+    fxf = fxf_usdnok
+    dates = [dt(2022, 1, 1), dt(2022, 1, 2), dt(2022, 1, 3), dt(2022, 1, 7), dt(2022, 1, 9)]
+    _, path = fxf._rate_with_path("usdnok", dates[0])
+    result = fxf._rates_on_dates("usdnok", dates, path)
+    for rate, date in zip(result, dates, strict=True):
+        assert rate == fxf.rate("usdnok", date)
+
+    with pytest.raises(ValueError, match="`settlement` cannot be before immediate"):
+        fxf._rates_on_dates("usdnok", [dt(2021, 12, 31)], path)
+
+
+def test_rates_on_dates_uses_path_memo(fxf_usdnok) -> None:
+    # the memoized path of the pair gives the same rates before and after an update
+    fxf = fxf_usdnok
+    nok_idx, usd_idx = fxf.currencies["nok"], fxf.currencies["usd"]
+    _, path = fxf._get_recursive_chain(fxf.transform, nok_idx, usd_idx)
+    dates = [dt(2022, 1, 7)]
+    first = fxf._rates_on_dates("usdnok", dates, path)
+    assert fxf._rates_on_dates("usdnok", dates, path) == first
+    assert first[0] == fxf.rate("usdnok", dt(2022, 1, 7))
+
+    fxf.update([{"usdnok": 9.0}])
+    result = fxf._rates_on_dates("usdnok", dates, path)
+    assert result[0] == fxf.rate("usdnok", dt(2022, 1, 7))
+    assert abs(result[0] - first[0] * 9.0 / 8.0) < 1e-12
+
+
 @pytest.mark.parametrize("settlement", [dt(2022, 1, 1), dt(2022, 1, 3), dt(2022, 1, 7)])
 def test_rate_path_immediate(settlement) -> None:
     usdusd = Curve({dt(2022, 1, 1): 1.0, dt(2022, 1, 10): 0.999})
@@ -794,6 +1166,36 @@ def test_rate_path_immediate(settlement) -> None:
     assert result == expected
 
 
+def test_rate_path_memoized(fxf_usdnok) -> None:
+    fxf = fxf_usdnok
+    rate1, path1 = fxf._rate_with_path("nokusd", dt(2022, 1, 5))
+    rate2, path2 = fxf._rate_with_path("nokusd", dt(2022, 1, 5))
+    assert path1 == path2
+    assert rate1 == rate2
+
+    # an update resets the memoized paths and the rate matches a newly constructed object
+    fxf.update([{"usdnok": 9.0}])
+    result, path3 = fxf._rate_with_path("nokusd", dt(2022, 1, 5))
+    expected = FXForwards(
+        FXRates({"usdnok": 9.0, "eurusd": 1.05}, settlement=dt(2022, 1, 3)),
+        fxf.fx_curves,
+    ).rate("nokusd", dt(2022, 1, 5))
+    assert path3 == path1
+    assert abs(result - expected) < 1e-12
+
+
+def test_rate_uses_replaced_curve(fxf_usdnok) -> None:
+    fxf = fxf_usdnok
+    nokeur = fxf.fx_curves["nokeur"]
+    before = fxf.rate("nokusd", dt(2022, 1, 5))
+    new_nokeur = Curve({dt(2022, 1, 1): 1.0, dt(2022, 1, 10): 0.99})
+    fxf.fx_curves["nokeur"] = new_nokeur
+    result = fxf.rate("nokusd", dt(2022, 1, 5))
+    expected = before * new_nokeur[dt(2022, 1, 5)] / nokeur[dt(2022, 1, 5)]
+    assert abs(result - expected) < 1e-12
+    assert abs(result - before) > 1e-6
+
+
 @pytest.mark.parametrize(
     "left",
     [
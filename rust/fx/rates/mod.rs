@@ -486,6 +486,64 @@ mod tests {
         }
     }
 
+    #[test]
+    fn fxrates_update_equals_try_new() {
+        let mut fxr = FXRates::try_new(
+            vec![
+                FXRate::try_new("eur", "usd", Number::F64(1.08), Some(ndt(2004, 1, 1))).unwrap(),
+                FXRate::try_new("usd", "jpy", Number::F64(110.0), Some(ndt(2004, 1, 1))).unwrap(),
+            ],
+            Some(Ccy::try_new("usd").unwrap()),
+        )
+        .unwrap();
+        let _ = fxr.set_ad_order(ADOrder::Zero);
+        let update =
+            FXRate::try_new("usd", "jpy", Number::F64(120.0), Some(ndt(2004, 1, 1))).unwrap();
+        fxr.update(vec![update]).unwrap();
+
+        let expected = FXRates::try_new(
+            vec![
+                FXRate::try_new("eur", "usd", Number::F64(1.08), Some(ndt(2004, 1, 1))).unwrap(),
+                FXRate::try_new("usd", "jpy", Number::F64(120.0), Some(ndt(2004, 1, 1))).unwrap(),
+            ],
+            Some(Ccy::try_new("usd").unwrap()),
+        )
+        .unwrap();
+        assert_eq!(fxr, expected)
+    }
+
+    #[test]
+    fn fxrates_update_settlement_error() {
+        let mut fxr = FXRates::try_new(
+            vec![
+                FXRate::try_new("eur", "usd", Number::F64(1.08), Some(ndt(2004, 1, 1))).unwrap(),
+                FXRate::try_new("usd", "jpy", Number::F64(110.0), Some(ndt(2004, 1, 1))).unwrap(),
+            ],
+            None,
+        )
+        .unwrap();
+        let expected = fxr.clone();
+        let result = fxr.update(vec![FXRate::try_new(
+            "usd",
+            "jpy",
+            Number::F64(120.0),
+            Some(ndt(2004, 1, 2)),
+        )
+        .unwrap()]);
+        assert!(result.is_err());
+        assert_eq!(fxr, expected);
+
+        let result = fxr.update(vec![FXRate::try_new(
+            "usd",
+            "jpy",
+            Number::F64(120.0),
+            None,
+        )
+        .unwrap()]);
+        assert!(result.is_err());
+        assert_eq!(fxr, expected)
+    }
+
     #[test]
     fn second_order_gradients_on_set_order() {
         let mut fxr = FXRates::try_new(